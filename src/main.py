@@ -8,48 +8,158 @@ and saves it in structured JSON Lines format for use with Promtail and Grafana L
 import hashlib
 import json
 import os
+import re
 import sys
+import threading
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
 import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 
-import requests
+import urllib3
 import yaml
 
+try:
+    import hyperscan
+except ImportError:  # Optional, classify_messages falls back to determine_log_level
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Optional, the json module is used instead
+    orjson = None
+
 # Configuration constants
 LOGIN_SID_ROUTE = "/login_sid.lua?version=2"
 DATA_LUA_ENDPOINT = "data.lua"
 DEFAULT_TIMEOUT = 30
+
 LOG_SOURCE = "fritzbox"
 LOG_COMPONENT = "system"
-
-# Log level classification patterns
-ERROR_PATTERNS = [
-    "fehler", "error", "gescheitert", "fehlgeschlagen", "failed", "failure", 
+LOG_WRITE_BUFFER_SIZE = 1 << 16
+# Number of string excludes from which a single regex beats substring tests
+EXCLUDE_ALTERNATION_THRESHOLD = 10
+LOG_TAIL_BLOCK_SIZE = 4096
+
+# Fields of a FRITZ!Box event log entry, extracted with a single C-level call
+LOG_ENTRY_FIELDS = itemgetter('date', 'time', 'msg', 'id')
+
+# Templates for written log entries; static fields are set once and the key
+# order matches the output format
+LOG_ENTRY_TEMPLATE = {
+    "timestamp": None,
+    "level": None,
+    "source": LOG_SOURCE,
+    "message": None,
+    "labels": None
+}
+LOG_LABELS_TEMPLATE = {
+    "date": None,
+    "time": None,
+    "code": None,
+    "component": LOG_COMPONENT,
+    "severity": None
+}
+
+# Shared connection pool, keeps the connection to the FRITZ!Box alive between
+# requests. Failed requests are not retried, redirects are followed.
+HTTP = urllib3.PoolManager(
+    timeout=DEFAULT_TIMEOUT,
+    retries=urllib3.Retry(
+        total=None, connect=0, read=0, status=0, other=0, redirect=5))
+
+# hashlib.pbkdf2_hmac is implemented by OpenSSL when it comes from _hashlib;
+# the pure Python fallback is orders of magnitude slower for large iteration counts
+PBKDF2_NATIVE = (getattr(hashlib.pbkdf2_hmac, "__module__", "") == "_hashlib"
+                 and "sha256" in hashlib.algorithms_available)
+
+# Log level classification patterns, matched against the lowercased message
+ERROR_PATTERNS = (
+    "fehler", "error", "gescheitert", "fehlgeschlagen", "failed", "failure",
     "nicht verfügbar", "unavailable", "timeout", "abgebrochen", "cancelled",
     "unterbrochen", "interrupted", "verbindung getrennt", "disconnected",
     "authentifizierungsfehler", "authentication error", "login failed",
     "anmeldung gescheitert", "verbindungsaufbau fehlgeschlagen",
     "connection failed", "nicht erreichbar", "unreachable"
-]
+)
 
-WARNING_PATTERNS = [
+WARNING_PATTERNS = (
     "warnung", "warning", "achtung", "hinweis",
     "timeout", "zeitüberschreitung", "langsam", "slow",
     "schwach", "weak", "instabil", "unstable",
     "überlastet", "overload", "verzögerung", "delay",
     "trennung", "disconnect", "verbindung unterbrochen",
     "zwangstrennung", "zuvorzukommen", "wartung", "maintenance"
-]
+)
 
-SUCCESS_PATTERNS = [
+SUCCESS_PATTERNS = (
     "erfolgreich", "successful", "successfully", "established", "hergestellt",
     "verbunden", "connected", "aktiviert", "activated", "verfügbar", "available",
     "erhalten", "received", "aktualisiert", "updated", "installiert", "installed"
-]
+)
+
+# Planned/preventive actions that should be warnings, not errors
+SPECIAL_CASE_RE = re.compile(
+    r"(?=.*zwangstrennung)(?=.*zuvorzukommen)"
+    r"|(?=.*kurz unterbrochen)(?=.*zuvorzukommen)",
+    re.DOTALL)
+
+# Term required by every special case, checked before running SPECIAL_CASE_RE
+SPECIAL_CASE_TERM = "zuvorzukommen"
+
+# Specific FRITZ!Box login/connection messages
+LOGIN_WORDS = ("anmeldung", "verbindung")
+LOGIN_SUCCESS_WORDS = ("erfolgreich", "successfully")
+LOGIN_FAILURE_WORDS = ("gescheitert", "failed", "fehlgeschlagen")
+
+
+def _compile_hyperscan_database():
+    """
+    Compiles the warning, error and special case patterns into a Hyperscan database.
+
+    The pattern id encodes the kind of match: warning patterns come first,
+    followed by error patterns and finally the special case term.
+
+    Returns:
+        The compiled database, or None if Hyperscan is not installed
+    """
+    if hyperscan is None:
+        return None
+    patterns = [*WARNING_PATTERNS, *ERROR_PATTERNS, SPECIAL_CASE_TERM]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(pattern).encode() for pattern in patterns],
+        ids=list(range(len(patterns))),
+        flags=[0] * len(patterns))
+    return database
+
+
+HYPERSCAN_DATABASE = _compile_hyperscan_database()
+# A Hyperscan scratch space can only be used by one scan at a time, so every
+# thread gets its own
+HYPERSCAN_SCRATCH = threading.local()
+
+# Label of the FRITZ!Box processed by the current thread, prefixed to its output
+OUTPUT_CONTEXT = threading.local()
+
+
+def log(message: str) -> None:
+    """
+    Prints a line of output, prefixed with the label of the current FRITZ!Box.
+
+    The line is written with a single call, so output of FRITZ!Boxes processed
+    in parallel does not run together.
+
+    Parameters:
+        message: The line to print
+    """
+    label = getattr(OUTPUT_CONTEXT, "label", None)
+    line = f"[{label}] {message}" if label else message
+    sys.stdout.write(line + "\n")
 
 
 class FritzBoxError(Exception):
@@ -78,6 +188,51 @@ class LoginState:
         self.is_pbkdf2 = challenge.startswith("2$")
 
 
+class ExcludeFilter:
+    def __init__(self, excludes: list):
+        """
+        Initializes an ExcludeFilter object from the configured exclusion criteria.
+
+        Short lists of string criteria are checked with plain substring tests.
+        From EXCLUDE_ALTERNATION_THRESHOLD strings on, they are combined into a
+        single precompiled alternation, which is only faster for long lists.
+        List criteria are kept as tuples of parts that must all be present in
+        the message.
+
+        Parameters:
+            excludes (list): A list of strings or lists of strings representing exclusion criteria.
+        """
+        patterns = [item for item in excludes if isinstance(item, str)]
+        if len(patterns) >= EXCLUDE_ALTERNATION_THRESHOLD:
+            self.substrings = ()
+            self.pattern = re.compile("|".join(map(re.escape, patterns)))
+        else:
+            self.substrings = tuple(patterns)
+            self.pattern = None
+        self.part_groups = tuple(
+            tuple(item) for item in excludes if isinstance(item, list))
+
+    def matches(self, message: str) -> bool:
+        """
+        Checks if a message matches any of the exclusion criteria.
+
+        Parameters:
+            message (str): The message to be checked for exclusion.
+
+        Returns:
+            bool: True if the message is excluded, False otherwise.
+        """
+        for substring in self.substrings:
+            if substring in message:
+                return True
+        if self.pattern is not None and self.pattern.search(message):
+            return True
+        for parts in self.part_groups:
+            if all(part in message for part in parts):
+                return True
+        return False
+
+
 def get_sid(box_url: str, username: str, password: str) -> str:
     """
     Retrieves the session ID (SID) for a given user by performing the login process.
@@ -100,15 +255,18 @@ def get_sid(box_url: str, username: str, password: str) -> str:
         raise FritzBoxConnectionError("Failed to get challenge") from ex
 
     if state.is_pbkdf2:
-        print("PBKDF2 supported")
+        log("PBKDF2 supported")
+        if not PBKDF2_NATIVE:
+            log("Warning: hashlib.pbkdf2_hmac is not backed by OpenSSL, "
+                  "login will be slow")
         challenge_response = calculate_pbkdf2_response(
             state.challenge, password)
     else:
-        print("Falling back to MD5")
+        log("Falling back to MD5")
         challenge_response = calculate_md5_response(state.challenge, password)
 
     if state.blocktime > 0:
-        print(f"Waiting for {state.blocktime} seconds...")
+        log(f"Waiting for {state.blocktime} seconds...")
         time.sleep(state.blocktime)
 
     try:
@@ -137,29 +295,61 @@ def get_login_state(box_url: str) -> LoginState:
     """
     url = box_url + LOGIN_SID_ROUTE
     try:
-        http_response = urllib.request.urlopen(url, timeout=DEFAULT_TIMEOUT)
-        xml = ET.fromstring(http_response.read())
-
-        challenge_elem = xml.find("Challenge")
-        blocktime_elem = xml.find("BlockTime")
-
-        if challenge_elem is None or challenge_elem.text is None:
+        http_response = HTTP.request("GET", url, preload_content=False)
+        try:
+            if http_response.status >= 400:
+                raise FritzBoxConnectionError(
+                    f"Failed to retrieve login state: HTTP {http_response.status}")
+            fields = read_xml_fields(http_response, ("Challenge", "BlockTime"))
+        finally:
+            # Read any rest of the body so the connection can be reused
+            http_response.drain_conn()
+
+        challenge = fields.get("Challenge")
+        blocktime_text = fields.get("BlockTime")
+
+        if challenge is None:
             raise FritzBoxConnectionError(
                 "Invalid challenge response from FRITZ!Box")
 
-        if blocktime_elem is None or blocktime_elem.text is None:
+        if blocktime_text is None:
             raise FritzBoxConnectionError(
                 "Invalid blocktime response from FRITZ!Box")
 
-        challenge = challenge_elem.text
-        blocktime = int(blocktime_elem.text)
+        blocktime = int(blocktime_text)
 
         return LoginState(challenge, blocktime)
-    except (urllib.error.URLError, ET.ParseError, ValueError) as ex:
+    except (urllib3.exceptions.HTTPError, ET.ParseError, ValueError) as ex:
         raise FritzBoxConnectionError(
             f"Failed to retrieve login state: {ex}") from ex
 
 
+def read_xml_fields(stream, tags: tuple) -> dict:
+    """
+    Reads the text of the given elements from an XML stream.
+
+    The stream is parsed incrementally and parsing stops as soon as all
+    requested elements have been seen, without building the whole tree.
+
+    Parameters:
+        stream: A binary file-like object containing the XML document
+        tags: The element tags to look for
+
+    Returns:
+        Dictionary mapping each found tag to its text; missing or empty elements are omitted
+
+    Raises:
+        ET.ParseError: If the XML is malformed before all tags were found
+    """
+    fields = {}
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag in tags and elem.text is not None:
+            fields[elem.tag] = elem.text
+            if len(fields) == len(tags):
+                break
+    return fields
+
+
 def calculate_pbkdf2_response(challenge: str, password: str) -> str:
     """
     Calculates the PBKDF2 response for the given challenge and password.
@@ -173,17 +363,36 @@ def calculate_pbkdf2_response(challenge: str, password: str) -> str:
     """
     challenge_parts = challenge.split("$")
     # Extract all necessary values encoded into the challenge
-    iter1 = int(challenge_parts[1])
-    salt1 = bytes.fromhex(challenge_parts[2])
     iter2 = int(challenge_parts[3])
     salt2 = bytes.fromhex(challenge_parts[4])
     # Hash twice, once with static salt...
-    hash1 = hashlib.pbkdf2_hmac("sha256", password.encode(), salt1, iter1)
+    hash1 = calculate_static_pbkdf2_hash(
+        password, challenge_parts[2], int(challenge_parts[1]))
     # Once with dynamic salt.
     hash2 = hashlib.pbkdf2_hmac("sha256", hash1, salt2, iter2)
     return f"{challenge_parts[4]}${hash2.hex()}"
 
 
+@lru_cache(maxsize=8)
+def calculate_static_pbkdf2_hash(password: str, salt1_hex: str, iter1: int) -> bytes:
+    """
+    Calculates the first PBKDF2 stage using the static salt of the challenge.
+
+    The static salt and iteration count stay the same between logins, so the
+    result is cached and a re-login only has to compute the dynamic stage.
+
+    Parameters:
+        password (str): The user's password.
+        salt1_hex (str): The static salt as hex string.
+        iter1 (int): The iteration count for the static salt.
+
+    Returns:
+        bytes: The derived key of the first stage.
+    """
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), bytes.fromhex(salt1_hex), iter1)
+
+
 def calculate_md5_response(challenge: str, password: str) -> str:
     """
     Calculates the MD5 response for the given challenge and password.
@@ -220,31 +429,37 @@ def send_response(box_url: str, username: str, challenge_response: str) -> str:
         FritzBoxConnectionError: If connection fails
         AuthenticationError: If authentication fails
     """
-    post_data_dict = {"username": username, "response": challenge_response}
-    post_data = urllib.parse.urlencode(post_data_dict).encode()
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    post_data = {"username": username, "response": challenge_response}
     url = box_url + LOGIN_SID_ROUTE
 
     try:
-        http_request = urllib.request.Request(url, post_data, headers)
-        http_response = urllib.request.urlopen(
-            http_request, timeout=DEFAULT_TIMEOUT)
-        xml = ET.fromstring(http_response.read())
-
-        sid_elem = xml.find("SID")
-        if sid_elem is None or sid_elem.text is None:
+        http_response = HTTP.request(
+            "POST", url, fields=post_data, encode_multipart=False,
+            preload_content=False)
+        try:
+            if http_response.status >= 400:
+                raise FritzBoxConnectionError(
+                    f"Failed to send login response: HTTP {http_response.status}")
+            sid = read_xml_fields(http_response, ("SID",)).get("SID")
+        finally:
+            # Read any rest of the body so the connection can be reused
+            http_response.drain_conn()
+        if sid is None:
             raise AuthenticationError("Invalid SID response from FRITZ!Box")
 
-        return sid_elem.text
-    except (urllib.error.URLError, ET.ParseError) as ex:
+        return sid
+    except (urllib3.exceptions.HTTPError, ET.ParseError) as ex:
         raise FritzBoxConnectionError(
             f"Failed to send login response: {ex}") from ex
 
 
+@lru_cache(maxsize=1024)
 def unix_timestamp_from_strings(date_string: str, time_string: str) -> int:
     """
     Converts the given date and time strings to a Unix timestamp.
 
+    Results are cached, as the FRITZ!Box often logs several events per second.
+
     Parameters:
         date_string (str): The date string in the format "dd.mm.yy".
         time_string (str): The time string in the format "HH:MM:SS".
@@ -252,8 +467,19 @@ def unix_timestamp_from_strings(date_string: str, time_string: str) -> int:
     Returns:
         int: The Unix timestamp representing the provided date and time.
     """
-    datetime_string = f"{date_string} {time_string}"
-    datetime_obj = datetime.strptime(datetime_string, "%d.%m.%y %H:%M:%S")
+    if (len(date_string) == 8 and date_string[2::3] == ".."
+            and len(time_string) == 8 and time_string[2::3] == "::"):
+        # Fast path for the fixed FRITZ!Box format, avoiding strptime
+        year = int(date_string[6:8])
+        # Same century pivot as strptime's %y
+        year += 2000 if year < 69 else 1900
+        datetime_obj = datetime(
+            year, int(date_string[3:5]), int(date_string[0:2]),
+            int(time_string[0:2]), int(time_string[3:5]), int(time_string[6:8]))
+    else:
+        datetime_string = f"{date_string} {time_string}"
+        datetime_obj = datetime.strptime(
+            datetime_string, "%d.%m.%y %H:%M:%S")
 
     # Get the Unix timestamp
     unix_timestamp = int(datetime_obj.timestamp())
@@ -261,6 +487,40 @@ def unix_timestamp_from_strings(date_string: str, time_string: str) -> int:
     return unix_timestamp
 
 
+def json_loads(data):
+    """
+    Parses a JSON document, using orjson if it is installed.
+
+    Parameters:
+        data: The JSON document as str or bytes
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_line(obj) -> bytes:
+    """
+    Serializes an object to a compact UTF-8 encoded JSON line, using orjson if it is installed.
+
+    Parameters:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+            + "\n").encode("utf-8")
+
+
 def get_last_timestamp(file_path: str) -> int:
     """
     Retrieves the last timestamp from a JSON Lines log file.
@@ -272,13 +532,24 @@ def get_last_timestamp(file_path: str) -> int:
         The last timestamp found in the log file or 1 if the file is empty or does not exist
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-            if lines:
-                last_line = lines[-1].strip()
-                if last_line:
-                    log_entry = json.loads(last_line)
-                    return int(log_entry.get("timestamp", 1))
+        with open(file_path, 'rb') as file:
+            # Only read the end of the file, growing the block until it
+            # contains the start of the last line
+            end = file.seek(0, os.SEEK_END)
+            block_size = LOG_TAIL_BLOCK_SIZE
+            while True:
+                start = max(0, end - block_size)
+                file.seek(start)
+                tail = file.read(end - start).rstrip()
+                newline = tail.rfind(b'\n')
+                if newline != -1 or start == 0:
+                    break
+                block_size *= 2
+
+            last_line = tail[newline + 1:]
+            if last_line:
+                log_entry = json_loads(last_line)
+                return int(log_entry.get("timestamp", 1))
             return 1
     except (FileNotFoundError, json.JSONDecodeError, ValueError, OSError):
         return 1
@@ -293,43 +564,43 @@ def create_or_append_to_log(file_path: str, data: list) -> None:
         data: A list of dictionaries containing the data to be written
     """
     last_timestamp = get_last_timestamp(file_path)
-    new_entries = 0
-
-    with open(file_path, mode='a', encoding='utf-8') as log_file:
-        for entry in data:
-            if int(entry["timestamp"]) > last_timestamp:
-                # Determine log level based on message content
-                log_level = determine_log_level(entry["message"])
-                
-                log_entry = {
-                    "timestamp": entry["timestamp"],
-                    "level": log_level,
-                    "source": LOG_SOURCE,
-                    "message": entry["message"],
-                    "labels": {
-                        "date": entry["date"],
-                        "time": entry["time"],
-                        "code": entry["code"],
-                        "component": LOG_COMPONENT,
-                        "severity": log_level
-                    }
-                }
-                log_file.write(json.dumps(
-                    log_entry, ensure_ascii=False) + '\n')
-                new_entries += 1
-
+    # Timestamps are already ints from unix_timestamp_from_strings
+    new_data = [entry for entry in data if entry["timestamp"] > last_timestamp]
+    # Determine log levels based on message content, for the whole batch
+    log_levels = classify_messages([entry["message"] for entry in new_data])
+    lines = []
+
+    for entry, log_level in zip(new_data, log_levels):
+        labels = LOG_LABELS_TEMPLATE.copy()
+        labels["date"] = entry["date"]
+        labels["time"] = entry["time"]
+        labels["code"] = entry["code"]
+        labels["severity"] = log_level
+
+        log_entry = LOG_ENTRY_TEMPLATE.copy()
+        log_entry["timestamp"] = entry["timestamp"]
+        log_entry["level"] = log_level
+        log_entry["message"] = entry["message"]
+        log_entry["labels"] = labels
+        lines.append(json_dumps_line(log_entry))
+
+    new_entries = len(new_data)
     if new_entries > 0:
-        print(f"Added {new_entries} new log entries")
+        # Write all new entries at once through a large buffer
+        with open(file_path, mode='ab',
+                  buffering=LOG_WRITE_BUFFER_SIZE) as log_file:
+            log_file.writelines(lines)
+        log(f"Added {new_entries} new log entries")
 
 
-def get_fritzbox_event_log(url: str, sid: str, excludes: list) -> list:
+def get_fritzbox_event_log(url: str, sid: str, excludes: ExcludeFilter) -> list:
     """
     Retrieves the event log data from the FritzBox using the provided session ID (SID).
 
     Parameters:
         url: The base URL of the FritzBox
         sid: The session ID obtained after successful login
-        excludes: List of message patterns to exclude from logs
+        excludes: Filter for the message patterns to exclude from logs
 
     Returns:
         A list of dictionaries representing the event log data
@@ -355,59 +626,65 @@ def get_fritzbox_event_log(url: str, sid: str, excludes: list) -> list:
     }
 
     try:
-        response = requests.post(
-            data_url, data=request_data, timeout=DEFAULT_TIMEOUT)
-    except requests.RequestException as ex:
+        response = HTTP.request(
+            "POST", data_url, fields=request_data, encode_multipart=False)
+        # Keep the raw bytes, the JSON parser decodes UTF-8 itself
+        event_log_data = response.data
+    except urllib3.exceptions.HTTPError as ex:
         raise FritzBoxConnectionError(
             f"Failed to retrieve event log: {ex}") from ex
 
-    if response.status_code == 200:
+    if response.status == 200:
         # Process the event log data in the response
-        event_log_data = response.text
-        print(f"Response length: {len(event_log_data)}")
-        print(f"Response starts with: {event_log_data[:100]}")
+        log(f"Response length: {len(event_log_data)}")
+        log(
+            f"Response starts with: {event_log_data[:100].decode('utf-8', 'replace')}")
 
         # Check if response is HTML (error page) or JSON
-        if event_log_data.strip().startswith('<!DOCTYPE html>') or event_log_data.strip().startswith('<html'):
-            print("ERROR: Received HTML response instead of JSON. This usually means:")
-            print("1. The session ID (SID) is invalid or expired")
-            print("2. The URL is incorrect")
-            print("3. The FritzBox requires additional authentication")
+        if event_log_data[:1024].lstrip().startswith((b'<!DOCTYPE html>', b'<html')):
+            log("ERROR: Received HTML response instead of JSON. This usually means:")
+            log("1. The session ID (SID) is invalid or expired")
+            log("2. The URL is incorrect")
+            log("3. The FritzBox requires additional authentication")
             return []
 
         try:
-            jdata = json.loads(event_log_data)
-        except json.JSONDecodeError as e:
-            print(f"JSON Decode Error: {e}")
-            print(f"Response text (first 500 chars): {event_log_data[:500]}")
+            jdata = json_loads(event_log_data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            log(f"JSON Decode Error: {e}")
+            log(
+                f"Response text (first 500 bytes): {event_log_data[:500].decode('utf-8', 'replace')}")
             return []
 
         logData = jdata.get("data", {}).get("log", [])
         if not logData:
-            print("No log data found in response")
+            log("No log data found in response")
             return []
 
         csvData = []
-        print(f"Processing {len(logData)} log entries...")
+        log(f"Processing {len(logData)} log entries...")
 
-        for i, entry in enumerate(list(logData)[::-1]):
+        for i, entry in enumerate(reversed(logData)):
             # Check if entry is a dictionary with required fields
             if not isinstance(entry, dict):
-                print(f"Skipping non-dict entry {i}: {entry}")
+                log(f"Skipping non-dict entry {i}: {entry}")
                 continue
 
             # Extract data from dictionary format
-            date_str = entry.get('date', '')
-            time_str = entry.get('time', '')
-            message = entry.get('msg', '')
-            entry_id = entry.get('id', '')
-
-            if not all([date_str, time_str, message]):
-                print(
+            try:
+                date_str, time_str, message, entry_id = LOG_ENTRY_FIELDS(entry)
+            except KeyError:
+                date_str = entry.get('date', '')
+                time_str = entry.get('time', '')
+                message = entry.get('msg', '')
+                entry_id = entry.get('id', '')
+
+            if not (date_str and time_str and message):
+                log(
                     f"Skipping incomplete entry {i}: missing required fields")
                 continue
 
-            if not is_excluded(message, excludes):
+            if not excludes.matches(message):
                 cdata = {
                     "timestamp": unix_timestamp_from_strings(date_str, time_str),
                     "date": date_str,
@@ -417,12 +694,12 @@ def get_fritzbox_event_log(url: str, sid: str, excludes: list) -> list:
                 }
                 csvData.append(cdata)
             # else:
-            #     print(f"Excluded Message: {Message}")
+            #     log(f"Excluded Message: {Message}")
 
         return csvData
     else:
-        print(
-            f"Failed to retrieve event log. Status code: {response.status_code}")
+        log(
+            f"Failed to retrieve event log. Status code: {response.status}")
         return []
 
 
@@ -437,59 +714,92 @@ def determine_log_level(message: str) -> str:
         The appropriate log level: 'error', 'warning', 'info', or 'debug'
     """
     message_lower = message.lower()
-    
+
     # Special cases: planned/preventive actions should be warnings, not errors
-    if ("zwangstrennung" in message_lower and "zuvorzukommen" in message_lower) or \
-       ("kurz unterbrochen" in message_lower and "zuvorzukommen" in message_lower):
+    if SPECIAL_CASE_TERM in message_lower and SPECIAL_CASE_RE.match(message_lower):
         return "warning"
-    
+
     # Check for error patterns (highest priority)
     for pattern in ERROR_PATTERNS:
         if pattern in message_lower:
             return "error"
-    
+
     # Check for warning patterns (medium priority)
     for pattern in WARNING_PATTERNS:
         if pattern in message_lower:
             return "warning"
-    
+
     # Check for success patterns (info level)
     for pattern in SUCCESS_PATTERNS:
         if pattern in message_lower:
             return "info"
-    
+
     # Check specific FRITZ!Box message patterns
-    if any(word in message_lower for word in ["anmeldung", "verbindung"]):
-        if any(word in message_lower for word in ["erfolgreich", "successfully"]):
+    if any(word in message_lower for word in LOGIN_WORDS):
+        if any(word in message_lower for word in LOGIN_SUCCESS_WORDS):
             return "info"
-        elif any(word in message_lower for word in ["gescheitert", "failed", "fehlgeschlagen"]):
+        elif any(word in message_lower for word in LOGIN_FAILURE_WORDS):
             return "error"
-    
+
     # Default to info level
     return "info"
 
 
-def is_excluded(message: str, excludes: list) -> bool:
+def classify_messages(messages: list) -> list:
     """
-    Checks if a message is excluded based on a list of exclusion criteria.
+    Determines the log levels for a batch of messages.
 
-    The exclusion criteria can be either strings or lists of strings. For strings,
-    the function checks if the item is present in the message. For lists, the function
-    checks if all elements in the list are present in the message.
+    Gives the same results as determine_log_level. If Hyperscan is installed,
+    the batch is joined into one buffer and scanned once for all patterns;
+    matches are mapped back to their message by offset.
 
     Parameters:
-        message: The message to be checked for exclusion
-        excludes: A list of strings or lists of strings representing exclusion criteria
+        messages: The log messages to analyze
 
     Returns:
-        True if the message is excluded based on any exclusion criteria, False otherwise
+        The log levels in the same order as the messages
     """
-    for item in excludes:
-        if isinstance(item, str) and item in message:
-            return True
-        elif isinstance(item, list) and all(part in message for part in item):
-            return True
-    return False
+    if HYPERSCAN_DATABASE is None or not messages:
+        return list(map(determine_log_level, messages))
+
+    messages_lower = [message.lower() for message in messages]
+    encoded = [message.encode() for message in messages_lower]
+    # No pattern contains the separator, so matches never span two messages
+    buffer = b"\n".join(encoded)
+    starts = list(accumulate(
+        (len(message) + 1 for message in encoded[:-1]), initial=0))
+
+    # Success patterns and the login fallback only ever yield "info" (the
+    # default) or "error" (already covered by ERROR_PATTERNS), so they are
+    # not scanned
+    levels = ["info"] * len(messages)
+    special_cases = []
+    warning_ids = len(WARNING_PATTERNS)
+    error_ids = warning_ids + len(ERROR_PATTERNS)
+
+    def on_match(pattern_id, start, end, flags, context):
+        index = bisect_right(starts, end - 1) - 1
+        if pattern_id < warning_ids:
+            if levels[index] == "info":
+                levels[index] = "warning"
+        elif pattern_id < error_ids:
+            levels[index] = "error"
+        else:
+            special_cases.append(index)
+
+    scratch = getattr(HYPERSCAN_SCRATCH, "scratch", None)
+    if scratch is None:
+        scratch = HYPERSCAN_SCRATCH.scratch = hyperscan.Scratch(
+            HYPERSCAN_DATABASE)
+    HYPERSCAN_DATABASE.scan(
+        buffer, match_event_handler=on_match, scratch=scratch)
+
+    # Special cases only need checking for messages that mention the term
+    for index in special_cases:
+        if SPECIAL_CASE_RE.match(messages_lower[index]):
+            levels[index] = "warning"
+
+    return levels
 
 
 def load_settings(path: str) -> dict:
@@ -516,12 +826,73 @@ def load_settings(path: str) -> dict:
         raise yaml.YAMLError(f"Invalid YAML format in {path}: {ex}") from ex
 
 
+def get_box_settings(settings: dict) -> list:
+    """
+    Builds the connection settings for every configured FRITZ!Box.
+
+    Entries of the optional "boxes" list inherit missing values from the top
+    level settings. Without a "boxes" list, the top level settings describe
+    a single FRITZ!Box.
+
+    Parameters:
+        settings: Dictionary containing the settings loaded from the YAML file
+
+    Returns:
+        A list of dictionaries with url, username, password, excludes and log_path
+    """
+    boxes = []
+    for box in settings.get("boxes") or [{}]:
+        merged = {**settings, **box}
+        boxes.append({
+            "url": merged.get("url", "http://fritz.box"),
+            "username": merged.get("username", ""),
+            "password": merged.get("password", ""),
+            "excludes": ExcludeFilter(merged.get("exclude", []) or []),
+            "log_path": merged.get("logpath", "fritzLog.jsonl"),
+        })
+    return boxes
+
+
+def process_box(box: dict, label: str = None) -> None:
+    """
+    Logs in to a FRITZ!Box, retrieves its event log and saves new entries.
+
+    Parameters:
+        box: The connection settings as returned by get_box_settings
+        label: Optional prefix for all output lines of this FRITZ!Box
+
+    Raises:
+        FritzBoxConnectionError: If connection to FRITZ!Box fails
+        AuthenticationError: If authentication fails
+    """
+    OUTPUT_CONTEXT.label = label
+    try:
+        log(f"Using username: {box['username']}")
+        log(f"Using password: {'*' * len(box['password'])}")
+        log(f"Connecting to: {box['url']}")
+
+        # Authenticate and retrieve logs
+        sid = get_sid(box["url"], box["username"], box["password"])
+        log(f"Successfully authenticated user: {box['username']}")
+        log(f"Session ID: {sid}")
+
+        logs = get_fritzbox_event_log(box["url"], sid, box["excludes"])
+        if logs:
+            create_or_append_to_log(box["log_path"], logs)
+            log(
+                f"Successfully processed {len(logs)} log entries to {box['log_path']}")
+        else:
+            log("No log entries found or retrieved")
+    finally:
+        OUTPUT_CONTEXT.label = None
+
+
 def main() -> None:
     """
     Main entry point for the FRITZ!Box Log Saver application.
 
-    Logs in to a FRITZ!Box device, retrieves the event log data, 
-    and saves it to a structured log file in JSON Lines format.
+    Logs in to the configured FRITZ!Box devices, retrieves the event log data,
+    and saves it to structured log files in JSON Lines format.
     """
     settings_file = os.path.join(os.path.dirname(sys.argv[0]), "settings.yaml")
 
@@ -539,34 +910,44 @@ def main() -> None:
     try:
         settings = load_settings(settings_file)
 
-        # Extract configuration with defaults
-        url = settings.get("url", "http://fritz.box")
-        username = settings.get("username", "")
-        password = settings.get("password", "")
-        excludes = settings.get("exclude", []) or []
-        log_path = settings.get("logpath", "fritzLog.jsonl")
+        boxes = get_box_settings(settings)
 
         # Validate required settings
-        if not username or not password:
-            print("Error: Username and password are required in settings.yaml")
-            sys.exit(1)
-
-        print(f"Using username: {username}")
-        print(f"Using password: {'*' * len(password)}")
-        print(f"Connecting to: {url}")
+        for box in boxes:
+            if not box["username"] or not box["password"]:
+                print("Error: Username and password are required in settings.yaml")
+                sys.exit(1)
 
-        # Authenticate and retrieve logs
-        sid = get_sid(url, username, password)
-        print(f"Successfully authenticated user: {username}")
-        print(f"Session ID: {sid}")
+        if len({box["log_path"] for box in boxes}) < len(boxes):
+            print("Error: Each FRITZ!Box needs its own logpath in settings.yaml")
+            sys.exit(1)
 
-        logs = get_fritzbox_event_log(url, sid, excludes)
-        if logs:
-            create_or_append_to_log(log_path, logs)
-            print(
-                f"Successfully processed {len(logs)} log entries to {log_path}")
+        if len(boxes) == 1:
+            process_box(boxes[0])
         else:
-            print("No log entries found or retrieved")
+            # Label output by URL, or by the unique log path if URLs repeat
+            if len({box["url"] for box in boxes}) == len(boxes):
+                labels = [box["url"] for box in boxes]
+            else:
+                labels = [box["log_path"] for box in boxes]
+
+            # Login (PBKDF2 releases the GIL) and network I/O overlap across boxes
+            failed = False
+            with ThreadPoolExecutor(max_workers=len(boxes)) as executor:
+                futures = {executor.submit(process_box, box, label): label
+                           for box, label in zip(boxes, labels)}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except FritzBoxError as ex:
+                        log(f"[{futures[future]}] Error: {ex}")
+                        failed = True
+                    except Exception as ex:
+                        # One failing box must not abort the others
+                        log(f"[{futures[future]}] Unexpected error: {ex!r}")
+                        failed = True
+            if failed:
+                sys.exit(1)
 
     except (FritzBoxError, FileNotFoundError, yaml.YAMLError) as ex:
         print(f"Error: {ex}")